@@ -6,7 +6,7 @@ import abc
 import re
 from binascii import hexlify
 from dataclasses import dataclass
-from functools import partial
+from functools import lru_cache, partial
 from itertools import accumulate, chain, repeat, starmap
 from math import isfinite
 from secrets import token_bytes
@@ -122,11 +122,14 @@ class Array(Atom):
     items: Iterable[Atom]
 
     def write(self) -> Iterable[bytes]:
-        yield b"["
+        # Arrays (e.g. of kerned text) typically consist of many small items,
+        # so it's more efficient to output them as one chunk.
+        parts = [b"["]
         for i in self.items:
-            yield from i.write()
-            yield b" "
-        yield b"]"
+            parts.extend(i.write())
+            parts.append(b" ")
+        parts.append(b"]")
+        return (b"".join(parts),)
 
 
 @add_slots
@@ -159,7 +162,7 @@ class Stream(Atom):
     meta: Collection[tuple[ASCII, Atom]] = ()
 
     def write(self) -> Iterable[bytes]:
-        content = compress(b"".join(self.content))
+        content = _compress(b"".join(self.content))
         yield from _write_dict(
             chain(
                 self.meta,
@@ -236,29 +239,53 @@ def write(
         resources_offset,
         xref_offset,
     ) = accumulate(offsets)
-    yield from _write_trailer(
-        [catalog_offset, pagetree_offset, resources_offset] + offsets,
-        xref_offset,
+    # The trailer consists of many tiny pieces (one per object),
+    # so we output it as a single chunk.
+    yield b"".join(
+        _write_trailer(
+            [catalog_offset, pagetree_offset, resources_offset] + offsets,
+            xref_offset,
+        )
     )
 
 
-_STRING_ESCAPES = {
-    b"\\": b"\\\\",
-    b"\n": b"\\n",
-    b"\r": b"\\r",
-    b"\t": b"\\t",
-    b"\b": b"\\b",
-    b"\f": b"\\f",
-    b"(": b"\\(",
-    b")": b"\\)",
-}
+# Small streams (e.g. the content of blank or templated pages, or
+# decorations) are often repeated verbatim, so it pays to cache their
+# compressed form. Large streams are rarely repeated, and we don't want to
+# keep them around in memory.
+_COMPRESS_CACHE_MAX_LENGTH = 4096
+_compress_cached = lru_cache(maxsize=64)(compress)
 
 
-def _replace_with_escape(m: re.Match[bytes]) -> bytes:
-    return _STRING_ESCAPES[m.group()]
+def _compress(b: bytes) -> bytes:
+    return (
+        _compress_cached(b)
+        if len(b) <= _COMPRESS_CACHE_MAX_LENGTH
+        else compress(b)
+    )
 
 
-_escape = partial(
-    re.compile(b"(%b)" % b"|".join(map(re.escape, _STRING_ESCAPES))).sub,
-    _replace_with_escape,
+# N.B. the backslash must be escaped first, so that it doesn't affect
+# the other escapes.
+_STRING_ESCAPES = (
+    (b"\\", b"\\\\"),
+    (b"\n", b"\\n"),
+    (b"\r", b"\\r"),
+    (b"\t", b"\\t"),
+    (b"\b", b"\\b"),
+    (b"\f", b"\\f"),
+    (b"(", b"\\("),
+    (b")", b"\\)"),
 )
+_needs_escape = re.compile(
+    b"[%b]" % re.escape(b"".join(c for c, _ in _STRING_ESCAPES))
+).search
+
+
+def _escape(s: bytes) -> bytes:
+    # Most strings don't need escaping. For those that do,
+    # chained replacing is faster than a regex substitution with a callback.
+    if _needs_escape(s):
+        for char, escaped in _STRING_ESCAPES:
+            s = s.replace(char, escaped)
+    return s
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import enum
 from dataclasses import dataclass, fields
-from itertools import chain, islice, tee
+from itertools import chain, islice, repeat, tee
 from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
@@ -334,11 +334,9 @@ class RGB(Sequence[float]):
         elif isinstance(v, str):
             assert v.startswith("#"), "RGB string must start with #"
             assert len(v) == 7, "RGB string must have 7 characters"
-            return RGB(
-                int(v[1:3], 16) / 255,
-                int(v[3:5], 16) / 255,
-                int(v[5:7], 16) / 255,
-            )
+            # All three components are decoded at once
+            r, g, b = bytes.fromhex(v[1:])
+            return RGB(r / 255, g / 255, b / 255)
         else:
             assert isinstance(v, RGB), "invalid RGB value"
             return v
@@ -382,10 +380,13 @@ class dictget(Generic[T, U]):
     default: U
 
     def __call__(self, k: T) -> U:
-        try:
-            return self._map[k]
-        except KeyError:
-            return self.default
+        # Not try/except: misses are common (e.g. kerning pairs),
+        # and raising KeyError is much slower than dict.get.
+        return self._map.get(k, self.default)
+
+    def many(self, ks: Iterable[T]) -> Iterator[U]:
+        "Look up many keys at once -- faster than calling for each key"
+        return map(self._map.get, ks, repeat(self.default))
 
 
 # The copious overloads are to enable mypy to
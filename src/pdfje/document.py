@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from io import BufferedWriter, RawIOBase
 from itertools import count, islice
 from pathlib import Path
 from typing import IO, Iterable, Iterator, final, overload
@@ -17,6 +18,8 @@ from .style import Style, StyleFull, StyleLike
 
 _OBJ_ID_FIRST_PAGE: atoms.ObjectID = OBJ_ID_RESOURCES + 1
 _OBJS_PER_PAGE = 2
+# Large enough to hold most page content streams in one go
+_FILE_BUFFER_SIZE = 1 << 16
 
 
 @final
@@ -117,41 +120,59 @@ class Document:
         elif isinstance(target, (str, os.PathLike)):
             self._write_to_path(Path(os.fspath(target)))
         else:  # i.e. IO[bytes]
-            target.writelines(self._write_iter())
+            self._write_to(target)
 
     def _write_iter(self) -> Iterator[bytes]:
         return atoms.write(_doc_objects(self.pages, self.style.setdefault()))
 
+    def _write_to(self, f: IO[bytes]) -> None:
+        # Each chunk is a complete PDF object, so we write them as they come
+        # instead of collecting the entire document first.
+        if isinstance(f, RawIOBase):
+            # Unbuffered files would get a system call for each object.
+            # We buffer them, but leave the file itself open for the caller.
+            buffered = BufferedWriter(f, _FILE_BUFFER_SIZE)
+            try:
+                buffered.writelines(self._write_iter())
+            finally:
+                buffered.detach()
+        else:
+            f.writelines(self._write_iter())
+
     def _write_to_path(self, p: Path) -> None:
-        with p.open("wb") as wfile:
-            wfile.writelines(self.write())
+        with p.open("wb", buffering=_FILE_BUFFER_SIZE) as wfile:
+            self._write_to(wfile)
 
 
 def _doc_objects(
     items: Iterable[Page | AutoPage], style: StyleFull
 ) -> Iterator[atoms.Object]:
     res = Resources()
-    obj_id = pagenum = 0
-    # FUTURE: the scoping of `pagenum` is a bit tricky here. Find a better
-    #         way to do this -- or add a specific test.
-    for pagenum, obj_id, page in zip(
-        count(1),
-        count(_OBJ_ID_FIRST_PAGE, step=_OBJS_PER_PAGE),
-        flatten(p.render(res, style, pagenum + 1) for p in items),
-    ):
-        yield from page.to_atoms(obj_id)
-
-    if not pagenum:
-        raise RuntimeError(
-            "Cannot write PDF document without at least one page"
+    try:
+        obj_id = pagenum = 0
+        # FUTURE: the scoping of `pagenum` is a bit tricky here. Find a better
+        #         way to do this -- or add a specific test.
+        for pagenum, obj_id, page in zip(
+            count(1),
+            count(_OBJ_ID_FIRST_PAGE, step=_OBJS_PER_PAGE),
+            flatten(p.render(res, style, pagenum + 1) for p in items),
+        ):
+            yield from page.to_atoms(obj_id)
+
+        if not pagenum:
+            raise RuntimeError(
+                "Cannot write PDF document without at least one page"
+            )
+        first_font_id = obj_id + _OBJS_PER_PAGE
+
+        yield from res.to_objects(first_font_id)
+        yield from _write_headers(
+            (obj_id - _OBJ_ID_FIRST_PAGE) // _OBJS_PER_PAGE + 1,
+            res.to_atoms(first_font_id),
         )
-    first_font_id = obj_id + _OBJS_PER_PAGE
-
-    yield from res.to_objects(first_font_id)
-    yield from _write_headers(
-        (obj_id - _OBJ_ID_FIRST_PAGE) // _OBJS_PER_PAGE + 1,
-        res.to_atoms(first_font_id),
-    )
+    finally:
+        # Also if writing fails or is abandoned halfway
+        res.close()
 
 
 _CATALOG_OBJ = (
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import chain
 from typing import Iterable, Iterator, Literal, Sequence, final
 
 from .atoms import LiteralStr, Real
@@ -12,7 +13,6 @@ from .common import (
     Pt,
     Streamable,
     add_slots,
-    pipe,
     setattr_frozen,
 )
 from .page import Drawing
@@ -67,8 +67,10 @@ class Line(Drawing):
         setattr_frozen(self, "stroke", stroke and RGB.parse(stroke))
 
     def render(self, _: Resources, __: StyleFull, /) -> Streamable:
-        yield b"%g %g m %g %g l " % (*self.start, *self.end)
-        yield from _finish(None, self.stroke, False)
+        return (
+            b"%g %g m %g %g l " % (*self.start, *self.end)
+            + _finish(None, self.stroke, False),
+        )
 
 
 @final
@@ -113,8 +115,10 @@ class Rect(Drawing):
         setattr_frozen(self, "stroke", stroke and RGB.parse(stroke))
 
     def render(self, _: Resources, __: StyleFull, /) -> Streamable:
-        yield b"%g %g %g %g re " % (*self.origin, self.width, self.height)
-        yield from _finish(self.fill, self.stroke, False)
+        return (
+            b"%g %g %g %g re " % (*self.origin, self.width, self.height)
+            + _finish(self.fill, self.stroke, False),
+        )
 
 
 @final
@@ -205,17 +209,27 @@ class Circle(Drawing):
         return _ellipse(self.center, width, width, self.fill, self.stroke)
 
 
-def _finish(fill: RGB | None, stroke: RGB | None, close: bool) -> Streamable:
+# NOTE: simple drawings are rendered as a single chunk of bytes.
+# This avoids generator overhead, which adds up for pages with many drawings.
+def _finish(fill: RGB | None, stroke: RGB | None, close: bool) -> bytes:
     if fill and stroke:
-        yield b"%g %g %g rg %g %g %g RG " % (*fill, *stroke)
-        yield b"b\n" if close else b"B\n"
+        return b"%g %g %g rg %g %g %g RG %b\n" % (
+            *fill,
+            *stroke,
+            b"b" if close else b"B",
+        )
     elif fill:
-        yield b"%g %g %g rg f\n" % fill.astuple()
+        return b"%g %g %g rg f\n" % fill.astuple()
     elif stroke:
-        yield b"%g %g %g RG " % stroke.astuple()
-        yield b"s\n" if close else b"S\n"
+        return b"%g %g %g RG %b\n" % (
+            *stroke,
+            b"s" if close else b"S",
+        )
     else:
-        yield b"n\n"
+        return b"n\n"
+
+
+_ELLIPSE_PATH = b"%g %g m " + b"%g %g %g %g %g %g c " * 4
 
 
 # based on https://stackoverflow.com/questions/2172798
@@ -230,32 +244,33 @@ def _ellipse(
     ye = y + h
     xm = x + w / 2
     ym = y + h / 2
-    yield b"%g %g m " % (x, ym)
-    yield b"%g %g %g %g %g %g c " % (
+    # The whole path is formatted at once, instead of per operator
+    path = _ELLIPSE_PATH % (
+        # start
+        x,
+        ym,
+        # bottom left
         x,
         ym - oy,
         xm - ox,
         y,
         xm,
         y,
-    )
-    yield b"%g %g %g %g %g %g c " % (
+        # bottom right
         xm + ox,
         y,
         xe,
         ym - oy,
         xe,
         ym,
-    )
-    yield b"%g %g %g %g %g %g c " % (
+        # top right
         xe,
         ym + oy,
         xm + ox,
         ye,
         xm,
         ye,
-    )
-    yield b"%g %g %g %g %g %g c " % (
+        # top left
         xm - ox,
         ye,
         x,
@@ -263,7 +278,7 @@ def _ellipse(
         x,
         ym,
     )
-    yield from _finish(fill, stroke, False)
+    return (path + _finish(fill, stroke, False),)
 
 
 @final
@@ -303,13 +318,15 @@ class Polyline(Drawing):
         setattr_frozen(self, "stroke", stroke and RGB.parse(stroke))
 
     def render(self, _: Resources, __: StyleFull, /) -> Streamable:
-        it = iter(self.points)
-        try:
-            yield b"%g %g m " % next(it)
-        except StopIteration:
-            return
-        yield from map(pipe(tuple, b"%g %g l ".__mod__), it)
-        yield from _finish(self.fill, self.stroke, self.close)
+        # Coordinates are read as one flat sequence of x-y pairs,
+        # so the entire path can be formatted in one go.
+        coords = tuple(chain.from_iterable(self.points))
+        if not coords:
+            return ()
+        return (
+            (b"%g %g m " + b"%g %g l " * (len(coords) // 2 - 1)) % coords
+            + _finish(self.fill, self.stroke, self.close),
+        )
 
 
 @final
@@ -357,7 +374,7 @@ class Text(Drawing, StyledMixin):
 
     def render(self, r: Resources, s: StyleFull, /) -> Streamable:
         state = s.as_state(r)
-        passages = list(self.flatten(r, s))
+        passages = self.flatten(r, s)
         return render_text(
             self.loc,
             state,
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import abc
 from dataclasses import dataclass, field
-from itertools import chain, count
+from functools import lru_cache
+from itertools import chain, compress, count
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, Tuple, Union, final
+from typing import TYPE_CHECKING, Iterable, Tuple, TypeVar, Union, final
 
 from .. import atoms
 from ..atoms import ASCII
@@ -14,7 +15,10 @@ from ..common import (
     Pos,
     Pt,
     add_slots,
+    always,
+    dictget,
     fix_abstract_properties,
+    second,
     setattr_frozen,
 )
 from ..compat import pairwise
@@ -22,6 +26,7 @@ from ..compat import pairwise
 FontID = bytes  # unique, internal identifier assigned to a font within a PDF
 GlyphPt = float  # length unit in glyph space
 TEXTSPACE_TO_GLYPHSPACE = 1000  # See PDF32000-1:2008 (9.7.3)
+_K = TypeVar("_K")
 
 
 @fix_abstract_properties
@@ -61,6 +66,22 @@ class Font(abc.ABC):
     @abc.abstractmethod
     def charkern(self, a: Char, b: Char, /) -> GlyphPt: ...
 
+    def measure(self, s: str, /, prev: Char | None) -> tuple[list[Kern], Pt]:
+        """The kerning and total width (at size 1) of the given string.
+        The result is independent of font size, which can be applied
+        afterwards.
+
+        Note
+        ----
+        The returned kerning list may be shared, and must not be mutated.
+        """
+        kerning = list(self.kern(s, prev))
+        return (
+            kerning,
+            self.width(s)
+            + sum(map(second, kerning)) / TEXTSPACE_TO_GLYPHSPACE,
+        )
+
 
 @final
 @add_slots
@@ -167,7 +188,10 @@ class BuiltinFont(Font):
         setattr_frozen(self, "spacewidth", self.charwidth(" "))
 
     def width(self, s: str) -> Pt:
-        return sum(map(self.charwidth, s)) / TEXTSPACE_TO_GLYPHSPACE
+        if isinstance(self.charwidth, always):
+            # Monospace fonts (e.g. Courier): no need to look up each char
+            return len(s) * self.spacewidth / TEXTSPACE_TO_GLYPHSPACE
+        return sum(_lookup_all(self.charwidth, s)) / TEXTSPACE_TO_GLYPHSPACE
 
     @staticmethod
     def encode(s: str) -> bytes:
@@ -180,6 +204,9 @@ class BuiltinFont(Font):
     def charkern(self, a: Char, b: Char) -> GlyphPt:
         return self.kerning((a, b)) if self.kerning else 0
 
+    def measure(self, s: str, /, prev: Char | None) -> tuple[list[Kern], Pt]:
+        return _measure_builtin(self, s, prev)
+
     def to_resource(self) -> atoms.Dictionary:
         return atoms.Dictionary(
             (b"Type", atoms.Name(b"Font")),
@@ -189,6 +216,11 @@ class BuiltinFont(Font):
         )
 
 
+def _lookup_all(f: Func[_K, GlyphPt], ks: Iterable[_K]) -> Iterable[GlyphPt]:
+    # Builtin fonts have width and kerning tables, which we can look up in bulk
+    return f.many(ks) if isinstance(f, dictget) else map(f, ks)
+
+
 KerningTable = Func[Tuple[Char, Char], GlyphPt]
 Kern = Tuple[Pos, GlyphPt]
 
@@ -198,9 +230,13 @@ def kern(
     s: str,
     prev: Char | None,
 ) -> Iterable[Kern]:
-    for i, pair in zip(
-        count(not prev),
-        pairwise(chain(prev, s) if prev else s),
-    ):
-        if space := table(pair):
-            yield (i, space)
+    spaces = list(_lookup_all(table, pairwise(chain(prev, s) if prev else s)))
+    # Most pairs don't need kerning. Selecting the ones that do with
+    # compress() is faster than checking each pair in a Python loop.
+    return compress(zip(count(not prev), spaces), spaces)
+
+
+# Builtin fonts exist for the lifetime of the program, so their measurements
+# can be cached globally. The same words occur over and over in a text,
+# so this is worth it.
+_measure_builtin = lru_cache(maxsize=4096)(Font.measure)
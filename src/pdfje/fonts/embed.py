@@ -3,8 +3,10 @@ from __future__ import annotations
 import enum
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from io import BytesIO
 from itertools import count
+from mmap import ACCESS_READ, mmap
 from operator import methodcaller
 from pathlib import Path
 from typing import TYPE_CHECKING, Collection, Iterable
@@ -22,11 +24,13 @@ from ..common import (
     pipe,
     setattr_frozen,
 )
+from ..compat import cache
 from .common import (
     TEXTSPACE_TO_GLYPHSPACE,
     Font,
     FontID,
     GlyphPt,
+    Kern,
     KerningTable,
     kern,
 )
@@ -99,6 +103,11 @@ if TYPE_CHECKING or HAS_FONTTOOLS:
         scale: float  # from glyph units to GlyphPt
         kerning: KerningTable | None
         spacewidth: GlyphPt = field(init=False)
+        # Measurements are cached per subset, so that they are released
+        # together with the document they belong to.
+        measured: dict[tuple[str, Char | None], tuple[list[Kern], Pt]] = field(
+            init=False, default_factory=dict
+        )
 
         encoding_width = 2
 
@@ -112,26 +121,25 @@ if TYPE_CHECKING or HAS_FONTTOOLS:
 
         @staticmethod
         def new(i: FontID, font: Path) -> Subset:
-            ttf = TTFont(font)
+            ttf = _load(font)
             scale = TEXTSPACE_TO_GLYPHSPACE / ttf["head"].unitsPerEm
             return Subset(
                 id=i,
                 ttf=ttf,
-                # FUTURE: cache calls to this function?
-                charwidth=pipe(
-                    ord,
-                    dictget(ttf.getBestCmap(), _REPLACEMENT_GLYPH),
-                    ttf["hmtx"].metrics.__getitem__,
-                    first,
-                    scale.__mul__,
+                # Looking up the glyph metrics takes several steps,
+                # while the number of distinct characters is small.
+                charwidth=cache(
+                    pipe(
+                        ord,
+                        dictget(ttf.getBestCmap(), _REPLACEMENT_GLYPH),
+                        ttf["hmtx"].metrics.__getitem__,
+                        first,
+                        scale.__mul__,
+                    )
                 ),
                 cids=defaultdict(count().__next__),
                 scale=scale,
-                kerning=(
-                    pipe(dictget(kernpairs, 0), scale.__mul__)
-                    if (kernpairs := get_kerning_pairs.for_font(ttf))
-                    else None
-                ),
+                kerning=_kerning(font, ttf),
             )
 
         def width(self, s: str) -> Pt:
@@ -154,6 +162,15 @@ if TYPE_CHECKING or HAS_FONTTOOLS:
         def charkern(self, a: Char, b: Char, /) -> GlyphPt:
             return self.kerning((a, b)) if self.kerning else 0
 
+        def measure(
+            self, s: str, /, prev: Char | None
+        ) -> tuple[list[Kern], Pt]:
+            try:
+                return self.measured[s, prev]
+            except KeyError:
+                result = self.measured[s, prev] = Font.measure(self, s, prev)
+                return result
+
         def to_objects(self, obj_id: atoms.ObjectID) -> Iterable[atoms.Object]:
             # PDF only supports 16-bit character/glyph entries,
             # thus there is a theoretical limit to the number of unique
@@ -255,6 +272,40 @@ if TYPE_CHECKING or HAS_FONTTOOLS:
             yield (cid_gid_map_id, _encode_cid_gid_map(self.ttf, self.cids))
             yield (file_id, _encode_ttf_with_side_effects(self.ttf))
 
+        def close(self) -> None:
+            # Releases the memory-mapped font file. Any tables needed after
+            # this must have been loaded already.
+            self.ttf.close()
+
+    def _load(font: Path) -> TTFont:
+        # The font file is memory-mapped and its tables loaded lazily,
+        # so only the parts actually used are read from disk.
+        # This matters for large (e.g. CJK) fonts.
+        with open(font, "rb") as f:
+            return TTFont(mmap(f.fileno(), 0, access=ACCESS_READ), lazy=True)
+
+    # Extracting the kerning pairs is the most expensive part of loading
+    # a font, while the result only depends on the file itself.
+    # The modification time is part of the key, so changed files are reloaded.
+    # The cache holds an (initially empty) slot instead of the table itself,
+    # so that the table can be built from the font which is already loaded.
+    @lru_cache(maxsize=32)
+    def _kerning_slot(font: Path, _mtime: int) -> list[KerningTable | None]:
+        return []
+
+    def _kerning(font: Path, ttf: TTFont) -> KerningTable | None:
+        slot = _kerning_slot(font, font.stat().st_mtime_ns)
+        if not slot:
+            scale = TEXTSPACE_TO_GLYPHSPACE / ttf["head"].unitsPerEm
+            # Scaling the kerning pairs up front allows them to be
+            # looked up in bulk, like those of builtin fonts.
+            slot.append(
+                dictget({pair: k * scale for pair, k in kernpairs.items()}, 0)
+                if (kernpairs := get_kerning_pairs.for_font(ttf))
+                else None
+            )
+        return slot[0]
+
     def _encode_bbox(f: TTFont, scale: float) -> atoms.Array:
         head = f["head"]
         return atoms.Array(
@@ -348,7 +399,12 @@ if TYPE_CHECKING or HAS_FONTTOOLS:
         yield _TO_UNICODE_CMAP_PRE
         yield b"%i beginbfchar\n" % len(m)
         for code, cid in m:
-            yield b"<%04X> <%b>\n" % (cid, _utf16be_hex(code))
+            yield (
+                # Most characters are in the BMP, and thus encoded as-is
+                b"<%04X> <%04X>\n" % (cid, code)
+                if code <= 0xFFFF
+                else b"<%04X> <%b>\n" % (cid, _utf16be_hex(code))
+            )
         yield _TO_UNICODE_CMAP_POST
 
     # based on PDF32000-1:2008, page 294
@@ -52,9 +52,7 @@ class AutoPage:
     def render(
         self, r: Resources, s: StyleFull, pnum: int, /
     ) -> Iterator[RenderedPage]:
-        pages: Iterator[PageFill] = map(
-            PageFill.new, map(self.template, count(pnum))
-        )
+        pages = _page_fills(map(self.template, count(pnum)))
         for block in map(_as_block, self.content):
             pages, filled = fill_pages(
                 pages, partial(block.into_columns, r, s)
@@ -66,5 +64,16 @@ class AutoPage:
         yield last.base.fill(r, s, flatten(chain(last.done, last.todo)))
 
 
+def _page_fills(pages: Iterable[Page]) -> Iterator[PageFill]:
+    # Templates typically return the same page over and over, so we can
+    # reuse its (immutable) empty layout instead of rebuilding it each time.
+    prev: Page | None = None
+    fill: PageFill
+    for p in pages:
+        if p is not prev:
+            prev, fill = p, PageFill.new(p)
+        yield fill
+
+
 def _as_block(b: str | Block) -> Block:
     return Paragraph(b) if isinstance(b, str) else b
@@ -146,7 +146,7 @@ class Paragraph(Block, StyledMixin):
     ) -> Iterator[ColumnFill]:
         style |= self.style
         state = style.as_state(res)
-        passages = list(self.flatten(res, style))
+        passages = self.flatten(res, style)
         lead = max_lead(passages, state)
         col = next(cs)
         for para in splitlines(passages):
@@ -32,6 +32,11 @@ class Resources:
         ):
             yield from sub.to_objects(i)
 
+    def close(self) -> None:
+        "Release the font files opened for the embedded fonts"
+        for sub in self._subsets.values():
+            sub.close()
+
     def to_atoms(self, first_id: atoms.ObjectID) -> atoms.Dictionary:
         return atoms.Dictionary(
             (
@@ -5,7 +5,6 @@ from itertools import chain
 from typing import (
     TYPE_CHECKING,
     ClassVar,
-    Generator,
     Iterator,
     Sequence,
     TypeVar,
@@ -122,24 +121,27 @@ class Style:
 
     # Use this instead of replace() to avoid triggering __init__.
     def _evolve(self, **kwargs: object) -> Style:
-        attrs = {f.name: getattr(self, f.name) for f in fields(self)}
-        attrs.update(kwargs)
         new = Style.__new__(Style)
-        for k, v in attrs.items():
-            setattr_frozen(new, k, v)
+        for name in _STYLE_FIELDS:
+            setattr_frozen(new, name, kwargs.get(name, getattr(self, name)))
         return new
 
     def __or__(self, other: StyleLike, /) -> Style:
         if isinstance(other, Style):
-            return self._evolve(
-                font=other.font or self.font,
-                size=_fallback(other.size, self.size),
-                bold=_fallback(other.bold, self.bold),
-                italic=_fallback(other.italic, self.italic),
-                color=other.color or self.color,
-                line_spacing=_fallback(other.line_spacing, self.line_spacing),
-                hyphens=_fallback(other.hyphens, self.hyphens),
-            )
+            # Shortcuts for common cases, avoiding needless copies
+            if other is Style.EMPTY:
+                return self
+            elif self is Style.EMPTY:
+                return other
+            # Fields set on the other style take precedence
+            new = Style.__new__(Style)
+            for name in _STYLE_FIELDS:
+                setattr_frozen(
+                    new,
+                    name,
+                    _fallback(getattr(other, name), getattr(self, name)),
+                )
+            return new
         elif isinstance(other, (TrueType, BuiltinTypeface)):
             return self._evolve(font=other)
         elif isinstance(other, str):
@@ -207,6 +209,7 @@ class Style:
 
 StyleLike = Union[Style, RGB, Typeface, HexColor]
 Style.EMPTY = Style()
+_STYLE_FIELDS = tuple(f.name for f in fields(Style))
 
 bold = Style(bold=True)
 """Shortcut for bold style."""
@@ -228,6 +231,8 @@ class StyleFull:
     hyphens: Hyphenator
 
     def __or__(self, s: Style, /) -> StyleFull:
+        if s is Style.EMPTY:
+            return self
         return StyleFull(
             s.font or self.font,
             _fallback(s.size, self.size),
@@ -300,20 +305,42 @@ class StyledMixin:
     content: Sequence[str | Span]
     style: Style
 
-    def flatten(
+    def flatten(self, r: Resources, base: StyleFull) -> list[Passage]:
+        # The passages are collected in one list, instead of being yielded
+        # through a chain of generators -- one for each level of nesting.
+        out: list[Passage] = []
+        self._flatten_into(out, r, base, iter(()))
+        return out
+
+    def _flatten_into(
         self,
+        out: list[Passage],
         r: Resources,
         base: StyleFull,
-        todo: Iterator[Command] = iter(()),
-    ) -> Generator[Passage, None, Iterator[Command]]:
+        todo: Iterator[Command],
+    ) -> Iterator[Command]:
+        if self.style is Style.EMPTY:
+            # A common case (e.g. spans used only for grouping) where
+            # there's no need to compute any style differences.
+            return self._flatten_content(out, r, base, todo)
         todo = chain(todo, self.style.diff(r, base))
         newbase = base | self.style
+        todo = self._flatten_content(out, r, newbase, todo)
+        return chain(todo, base.diff(r, newbase))
+
+    def _flatten_content(
+        self,
+        out: list[Passage],
+        r: Resources,
+        base: StyleFull,
+        todo: Iterator[Command],
+    ) -> Iterator[Command]:
         for item in self.content:
             if isinstance(item, str):
-                yield Passage(Chain.squash(todo), item)
+                out.append(Passage(Chain.squash(todo), item))
             else:
-                todo = yield from item.flatten(r, newbase, todo)
-        return chain(todo, base.diff(r, newbase))
+                todo = item._flatten_into(out, r, base, todo)
+        return todo
 
 
 @final
@@ -113,10 +113,16 @@ def take_box(
     lines: list[Line] = []
     queue_prev = queue
     while queue and len(lines) < max_line_count:
-        # OPTIMIZE: it'd be more efficient to only 'tee' on the last line
-        queue, queue_prev = tee(queue)
+        # We only need to be able to undo the last line, so we only 'tee'
+        # if we know it's the last line that fits in the box.
+        if len(lines) == max_line_count - 1:
+            queue, queue_prev = tee(queue)
         queue, ln = take_line(queue, width)
         lines.append(ln)
+        if queue is None:
+            # The paragraph ended on this line, which then contains
+            # exactly the words that were left in the queue.
+            queue_prev = iter(ln.words)
     return _FilledBox(queue, lines, queue_prev)
 
 
@@ -127,10 +133,11 @@ def take_line(
     content: list[WordLike] = []
 
     for word in ws:
-        if word.pruned_width() > space:
+        # The pruned width is needed for both checks -- measure it once.
+        if (pruned_width := word.pruned_width()) > space:
             break
 
-        space -= word.width
+        space -= pruned_width + word.prunable_space()
         content.append(word)
     else:
         # i.e. this is the last line of the paragraph
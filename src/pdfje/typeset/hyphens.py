@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
+from functools import lru_cache, partial
 from itertools import chain, starmap
 from typing import TYPE_CHECKING, Callable, Iterable, Union
 
@@ -43,11 +43,18 @@ if HAS_PYPHEN:
 
     def parse_hyphenator(p: HyphenatorLike) -> Hyphenator:
         if isinstance(p, Pyphen):
-            return partial(_pyphenate, p)
+            return _from_pyphen(p)
         elif p is None:
             return never_hyphenate
         return p
 
+    # Reusing the same hyphenator for the same Pyphen instance ensures
+    # styles compare equal, and that text state (and the words measured
+    # with it) can be shared between paragraphs.
+    @lru_cache(maxsize=32)
+    def _from_pyphen(p: Pyphen) -> Hyphenator:
+        return partial(_pyphenate, p)
+
     def _pyphenate(p: Pyphen, txt: str) -> Iterable[str]:
         return (
             map(
@@ -58,7 +65,7 @@ if HAS_PYPHEN:
             else (txt,)
         )
 
-    default_hyphenator: Hyphenator = partial(_pyphenate, Pyphen(lang="en_US"))
+    default_hyphenator: Hyphenator = _from_pyphen(Pyphen(lang="en_US"))
 
 else:  # pragma: no cover
     from ..vendor.hyphenate import hyphenate_word
@@ -8,10 +8,11 @@ Changes from the original algorithm:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from math import inf
 from operator import attrgetter
 from typing import Callable, Iterable, Literal, Sequence
 
-from ..common import add_slots, peek
+from ..common import add_slots
 from ..compat import pairwise
 
 Pos = int  # position in the list of boxes
@@ -43,7 +44,7 @@ class Box:
 
 
 def optimum_fit(
-    bs: Iterable[Box],
+    bs: Sequence[Box],
     width: Callable[[LineNum], float],
     tol: float,
     hyphen_penalty: float = 100,
@@ -98,13 +99,25 @@ def optimum_fit(
     # FUTURE: The ragged case probably be optimized further -- by eliminating
     #         the fitness difference penalty, for example.
     ratio = ratio_ragged if ragged else ratio_justified
-    g = _BreakNetwork()
-
-    try:
-        box_next, bs = peek(iter(bs))
-    except StopIteration:
+    if not bs:
         return ()
 
+    # A quick first-fit pass gives us an upper bound for the demerits.
+    # This allows us to discard many hopeless breaks early on,
+    # which especially pays off for high tolerances.
+    g = _BreakNetwork(
+        _first_fit_demerits(
+            bs,
+            width,
+            tol,
+            hyphen_penalty,
+            consecutive_hyphen_penalty,
+            fit_diff_penalty,
+            ratio,
+        )
+    )
+
+    box_next = bs[0]
     pos = 0
     for pos, (box, box_next) in enumerate(pairwise(bs), start=1):
         if box.no_break:
@@ -125,35 +138,161 @@ def optimum_fit(
                 g.remove(node)
             elif r <= tol:
                 fit = _fitness(r)
-                g.add(
-                    _BreakNode(
-                        pos,
-                        node.line + 1,
-                        r,
-                        fit,
-                        (
-                            _main_demerit(hyphen_penalty * box.hyphenated, r)
-                            + (
-                                consecutive_hyphen_penalty
-                                * box.hyphenated
-                                * node.hyphenated
-                            )
-                            + (abs(fit - node.fitness) > 1) * fit_diff_penalty
-                            + node.demerits
-                        ),
-                        box.incl_space,
-                        box_next.stretch,
-                        box_next.shrink,
-                        box.hyphenated,
-                        node,
-                    )
+                demerits = _break_demerits(
+                    node,
+                    r,
+                    fit,
+                    box,
+                    hyphen_penalty,
+                    consecutive_hyphen_penalty,
+                    fit_diff_penalty,
                 )
+                # Most candidate breaks are discarded, so we only create
+                # the node once we know it's an improvement.
+                if g.admits(node.line + 1, pos, fit, demerits):
+                    g.add(
+                        _BreakNode(
+                            pos,
+                            node.line + 1,
+                            r,
+                            fit,
+                            demerits,
+                            box.incl_space,
+                            box_next.stretch,
+                            box_next.shrink,
+                            box.hyphenated,
+                            node,
+                        )
+                    )
 
     return _optimal_end(
         g.nodes(), box_next, pos + 1, width, fit_diff_penalty, ratio
     ).unroll()
 
 
+def _next_node(
+    node: _BreakNode,
+    pos: Pos,
+    r: Ratio,
+    box: Box,
+    box_next: Box,
+    hyphen_penalty: float,
+    consecutive_hyphen_penalty: float,
+    fit_diff_penalty: float,
+) -> _BreakNode:
+    fit = _fitness(r)
+    return _BreakNode(
+        pos,
+        node.line + 1,
+        r,
+        fit,
+        _break_demerits(
+            node,
+            r,
+            fit,
+            box,
+            hyphen_penalty,
+            consecutive_hyphen_penalty,
+            fit_diff_penalty,
+        ),
+        box.incl_space,
+        box_next.stretch,
+        box_next.shrink,
+        box.hyphenated,
+        node,
+    )
+
+
+def _break_demerits(
+    node: _BreakNode,
+    r: Ratio,
+    fit: Fitness,
+    box: Box,
+    hyphen_penalty: float,
+    consecutive_hyphen_penalty: float,
+    fit_diff_penalty: float,
+) -> float:
+    return (
+        _main_demerit(hyphen_penalty * box.hyphenated, r)
+        + (consecutive_hyphen_penalty * box.hyphenated * node.hyphenated)
+        + (abs(fit - node.fitness) > 1) * fit_diff_penalty
+        + node.demerits
+    )
+
+
+def _end_demerits(
+    node: _BreakNode, r: Ratio, fit_diff_penalty: float
+) -> float:
+    return (
+        _main_demerit(0, r)
+        + (abs(_fitness(r) - node.fitness) > 1) * fit_diff_penalty
+        + node.demerits
+    )
+
+
+def _first_fit_demerits(
+    bs: Sequence[Box],
+    width: Callable[[LineNum], float],
+    tol: float,
+    hyphen_penalty: float,
+    consecutive_hyphen_penalty: float,
+    fit_diff_penalty: float,
+    ratio: Callable[
+        [CumulativeWidth, CumulativeWidth, CumulativeWidth, Box, float], Ratio
+    ],
+) -> float:
+    """The demerits of greedily breaking each line as late as possible.
+    Because these breaks are also considered by the optimum-fit algorithm,
+    this is an upper bound for the optimal demerits.
+    Returns infinity if first-fit doesn't find breaks within tolerance."""
+    node = fitting = _ROOT
+    for pos, (box, box_next) in enumerate(pairwise(bs), start=1):
+        if box.no_break:
+            continue
+        r = ratio(
+            node.measure, node.stretch, node.shrink, box, width(node.line)
+        )
+        if r < -1:
+            if fitting is node:
+                return inf
+            node = fitting
+            r = ratio(
+                node.measure, node.stretch, node.shrink, box, width(node.line)
+            )
+            if r < -1:
+                return inf
+        if r <= tol:
+            fitting = _next_node(
+                node,
+                pos,
+                r,
+                box,
+                box_next,
+                hyphen_penalty,
+                consecutive_hyphen_penalty,
+                fit_diff_penalty,
+            )
+
+    last = bs[-1]
+    r = min(
+        ratio(node.measure, node.stretch, node.shrink, last, width(node.line)),
+        0,
+    )
+    if r <= -1:
+        if fitting is node:
+            return inf
+        node = fitting
+        r = min(
+            ratio(
+                node.measure, node.stretch, node.shrink, last, width(node.line)
+            ),
+            0,
+        )
+        if r <= -1:
+            return inf
+    return _end_demerits(node, r, fit_diff_penalty)
+
+
 @add_slots
 @dataclass(frozen=True)
 class Break:
@@ -181,9 +320,7 @@ def _optimal_end(
         _EndNode(
             pos,
             r,
-            _main_demerit(0, r)
-            + (abs(_fitness(r) - n.fitness) > 1) * fit_diff_penalty
-            + n.demerits,
+            _end_demerits(n, r, fit_diff_penalty),
             box.incl_space,
             n,
         )
@@ -296,9 +433,10 @@ _ROOT = _BreakNode(0, 0, 0, 1, 0, 0, 0, 0, False, NotImplemented)
 
 class _BreakNetwork:
     "A directed acyclic graph of possible breaks."
-    __slots__ = ("_inner",)
+    __slots__ = ("_inner", "_bound")
 
-    def __init__(self) -> None:
+    def __init__(self, bound: float = inf) -> None:
+        self._bound = bound  # breaks with more demerits are never optimal
         self._inner: dict[tuple[LineNum, Pos, Fitness], _BreakNode] = {
             (0, 0, 1): _ROOT
         }
@@ -307,15 +445,22 @@ class _BreakNetwork:
     def nodes(self) -> Iterable[_BreakNode]:
         return self._inner.values()
 
-    def add(self, n: _BreakNode) -> None:
-        key = (n.line, n.pos, n.fitness)
+    def admits(
+        self, line: LineNum, pos: Pos, fit: Fitness, demerits: float
+    ) -> bool:
+        "Whether a break with these properties would be added"
         # OPTIMIZE: from the paper: "we need not remember the Class 0
         # possibility if its total demerits exceed those of the Class 2 break
         # plus the demerits for contrasting lines, since the Class 0
         # breakpoint will never be optimum in such a case."
-        old = self._inner.get(key)
-        if old is None or n.demerits < old.demerits:
-            self._inner[key] = n
+        if demerits > self._bound:
+            return False
+        old = self._inner.get((line, pos, fit))
+        return old is None or demerits < old.demerits
+
+    def add(self, n: _BreakNode) -> None:
+        "Add a break. Check first whether it's admitted."
+        self._inner[(n.line, n.pos, n.fitness)] = n
 
     def is_empty(self) -> bool:
         return not self._inner
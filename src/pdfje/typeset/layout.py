@@ -75,11 +75,13 @@ class Line(Streamable):
     def width(self) -> Pt: ...
 
 
+# N.B. lines consist of many small chunks. By joining them here,
+# the enclosing generators only need to pass along one chunk per line.
 def _render_left(lines: Iterable[Line], lead: Pt, _: Pt) -> Iterator[bytes]:
     yield b"%g TL\n" % lead
     for ln in lines:
         yield b"T*\n"
-        yield from ln
+        yield b"".join(ln)
 
 
 def _render_centered(
@@ -87,7 +89,7 @@ def _render_centered(
 ) -> Iterator[bytes]:
     for ln in lines:
         yield b"%g %g TD\n" % ((prev_width - ln.width) / 2, -lead)
-        yield from ln
+        yield b"".join(ln)
         prev_width = ln.width
 
 
@@ -96,7 +98,7 @@ def _render_right(
 ) -> Iterator[bytes]:
     for ln in lines:
         yield b"%g %g TD\n" % ((prev_width - ln.width), -lead)
-        yield from ln
+        yield b"".join(ln)
         prev_width = ln.width
 
 
@@ -10,7 +10,14 @@ from pdfje.fonts.common import TEXTSPACE_TO_GLYPHSPACE
 from ..atoms import LiteralStr, Real
 from ..common import XY, Align, Pt, add_slots, peek
 from ..compat import cache
-from .knuth_plass import Box, Break, NoFeasibleBreaks, optimum_fit
+from .knuth_plass import (
+    Box,
+    Break,
+    NoFeasibleBreaks,
+    optimum_fit,
+    ratio_justified,
+    ratio_ragged,
+)
 from .layout import Line as _Line
 from .layout import ShapedText
 from .state import NO_OP, Command
@@ -261,6 +268,13 @@ def find_breaks(
         )
 
 
+def _fits_on_one_line(last: Box, width: Pt, ragged: bool) -> bool:
+    # This is the same check optimum_fit() does for the final line,
+    # applied to a paragraph starting at the very first box.
+    ratio = ratio_ragged if ragged else ratio_justified
+    return min(ratio(0, 0, 0, last, width), 0) > -1
+
+
 def _lines_per_column(
     ls: Sequence[Line], counts: Iterable[int]
 ) -> Iterator[Sequence[Line]]:
@@ -297,23 +311,24 @@ def shape(
         yield ShapedText((Line.EMPTY,), lead, align, lead)
         return
 
-    breaks = find_breaks(boxes, cache(col_queue.line_length), ragged, params)
-    lines = list(into_lines(breaks, fragments))
-
-    # redo everything if there's an orphaned first line
-    # OPTIMIZE: to prevent running the optimization twice, we could
-    #           do an initial check if the first line will very *likely*
-    #           be orphaned. This check can't be 100% accurate, but it
-    #           would save time for obvious cases.
-    if (
-        avoid_orphans
-        and allow_empty
-        and col_queue.line_counts[0] == 1
-        and len(lines) > 1
-        and col_queue.line_counts[1] >= 2
-    ):
-        yield ShapedText((), lead, align, 0)
-        col_queue.remove_first_column()
+    lines: list[Line] | None = None
+
+    # skip the first column if it would contain an orphaned first line.
+    # If the paragraph can't possibly fit on a single line, we know this
+    # in advance -- saving us from running the optimization twice.
+    if avoid_orphans and allow_empty and col_queue.line_counts[0] == 1:
+        if _fits_on_one_line(boxes[-1], col_queue.line_length(0), ragged):
+            breaks = find_breaks(
+                boxes, cache(col_queue.line_length), ragged, params
+            )
+            lines = list(into_lines(breaks, fragments))
+        if lines is None or len(lines) > 1:
+            col_queue.line_length(1)  # ensure the next column is loaded
+            yield ShapedText((), lead, align, 0)
+            col_queue.remove_first_column()
+            lines = None
+
+    if lines is None:
         breaks = find_breaks(
             boxes, cache(col_queue.line_length), ragged, params
         )
@@ -134,8 +134,12 @@ class State(Streamable):
     lead: Pt = field(init=False, compare=False)  # cached calculation
 
     def __iter__(self) -> Iterator[bytes]:
-        yield from SetFont(self.font, self.size)
-        yield from SetColor(self.color)
+        # Equivalent to SetFont followed by SetColor, in a single chunk
+        yield b"/%b %g Tf\n%g %g %g rg\n" % (
+            self.font.id,
+            self.size,
+            *self.color.astuple(),
+        )
 
     def __post_init__(self) -> None:
         setattr_frozen(self, "lead", self.size * self.line_spacing)
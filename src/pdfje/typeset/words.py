@@ -10,6 +10,7 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import chain
 from typing import ClassVar, Generator, Iterable, Iterator, Sequence, TypeVar
 
@@ -23,10 +24,10 @@ from ..common import (
     Streamable,
     add_slots,
     fix_abstract_properties,
-    second,
 )
 from ..compat import pairwise
 from ..fonts.common import TEXTSPACE_TO_GLYPHSPACE, Font, GlyphPt, Kern
+from ..fonts.embed import Subset
 from .state import NO_OP, Command, State
 
 _T = TypeVar("_T")
@@ -137,15 +138,8 @@ class Slug(WordLike):
     # FUTURE: rename?
     @staticmethod
     def new(s: str, state: State, prev: Char | None) -> Slug:
-        font = state.font
-        kern = list(font.kern(s, prev))
-        return Slug(
-            s,
-            kern,
-            (font.width(s) + sum(map(second, kern)) / TEXTSPACE_TO_GLYPHSPACE)
-            * state.size,
-            state,
-        )
+        kern, width = state.font.measure(s, prev)
+        return Slug(s, kern, width * state.size, state)
 
     def without_init_kern(self) -> Slug:
         kern = self.kern
@@ -273,10 +267,10 @@ class MixedSlug(WordLike):
 
     def without_init_kern(self) -> MixedSlug:
         (first, cmd), *rest = self.segments
-        return MixedSlug(
-            ((first.without_init_kern(), cmd), *rest),
-            self.state,
-        )
+        # Shortcut for the common case, avoiding a needless copy
+        if (first_new := first.without_init_kern()) is first:
+            return self
+        return MixedSlug(((first_new, cmd), *rest), self.state)
 
     def has_init_kern(self) -> bool:
         return self.segments[0][0].has_init_kern()
@@ -323,6 +317,21 @@ def into_syllables(s: str, hyphens: Hyphenator) -> Iterable[str]:
         yield leftover + s[end:]
 
 
+def _new_word(s: str, state: State, prev: Char | None) -> Word:
+    s, tail = TrailingSpace.parse(s, state, prev)
+    segments = []
+    for part in into_syllables(s, state.hyphens):
+        segments.append(Slug.new(part, state, prev))
+        prev = part[-1]
+    return Word(tuple(segments), tail, state)
+
+
+# Words repeat a lot in natural text, and splitting them into measured
+# syllables is relatively expensive. Since words are immutable,
+# we can reuse them.
+_new_word_cached = lru_cache(maxsize=4096)(_new_word)
+
+
 @add_slots
 @dataclass(frozen=True)
 class Word(WordLike):
@@ -351,12 +360,14 @@ class Word(WordLike):
 
     @staticmethod
     def new(s: str, state: State, prev: Char | None) -> Word:
-        s, tail = TrailingSpace.parse(s, state, prev)
-        segments = []
-        for part in into_syllables(s, state.hyphens):
-            segments.append(Slug.new(part, state, prev))
-            prev = part[-1]
-        return Word(tuple(segments), tail, state)
+        # Embedded fonts belong to a single document. Caching their words
+        # globally would keep them alive after the document is written.
+        if isinstance(state.font, Subset):
+            return _new_word(s, state, prev)
+        try:
+            return _new_word_cached(s, state, prev)
+        except TypeError:  # e.g. a custom hyphenator which isn't hashable
+            return _new_word(s, state, prev)
 
     def hyphenate(self, space: Pt, /) -> tuple[Word | None, Word]:
         if len(self.boxes) < 1 or self.boxes[0].with_hyphen().width > space:
@@ -611,23 +622,17 @@ def indent_first(ws: Iterable[WordLike], amount: Pt) -> Iterator[WordLike]:
 # FUTURE: handle generic iterable
 def _encode_kerning(
     txt: str, kerning: Sequence[Kern], f: Font
-) -> Iterable[LiteralStr | Real]:
+) -> Sequence[LiteralStr | Real]:
     encoded = f.encode(txt)
-    try:
-        index_prev, space = kerning[0]
-    except IndexError:
-        yield LiteralStr(encoded)
-        return
-
-    if index_prev == 0:  # i.e. the case where we kern before any text
-        yield Real(-space)
-        kerning = kerning[1:]
-
-    index_prev = index = 0
+    result: list[LiteralStr | Real] = []
+    index_prev = 0
     for index, space in kerning:
-        index *= f.encoding_width
-        yield LiteralStr(encoded[index_prev:index])
-        yield Real(-space)
-        index_prev = index
-
-    yield LiteralStr(encoded[index:])
+        # Only the first kern can be at index 0, i.e. before any text.
+        # There's no need to output an empty string before it.
+        if index:
+            index *= f.encoding_width
+            result.append(LiteralStr(encoded[index_prev:index]))
+            index_prev = index
+        result.append(Real(-space))
+    result.append(LiteralStr(encoded[index_prev:]))
+    return result
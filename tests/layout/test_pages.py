@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from pdfje import Page
+from pdfje.layout.pages import _page_fills
+from pdfje.units import A5
+
+
+def test_page_fills_reused_for_same_page():
+    page = Page()
+    other = Page(size=A5)
+    fills = list(_page_fills([page, page, other, page]))
+    assert [f.base for f in fills] == [page, page, other, page]
+    assert fills[0] is fills[1]
+    assert fills[1] is not fills[3]
+    assert fills[2].base is other
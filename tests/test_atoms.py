@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from zlib import decompress
+
 import pytest
 from hypothesis import given
 from hypothesis.strategies import binary
 
-from pdfje.atoms import HexString, _escape, sanitize_name
+from pdfje.atoms import HexString, Stream, _escape, sanitize_name
 
 
 @pytest.mark.parametrize(
@@ -53,3 +55,18 @@ def test_escape_fuzzing(bytestr):
 )
 def test_hex_string(string, expect):
     assert b"".join(HexString(string).write()).upper() == expect
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"0 0 m 1 1 l S\n", b"x" * 10_000],
+    ids=["empty", "small", "large"],
+)
+def test_stream(content):
+    for _ in range(2):  # once more to test caching
+        output = b"".join(Stream([content]).write())
+        head, rest = output.split(b"\nstream\n")
+        compressed, tail = rest.split(b"\nendstream")
+        assert decompress(compressed) == content
+        assert b"/Length %i" % len(compressed) in head
+        assert tail == b""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from pdfje.common import RGB, XY, Sides
+from pdfje.common import RGB, XY, Sides, dictget
 
 from .common import approx
 
@@ -97,6 +97,7 @@ class TestRGB:
         assert parsed.red == approx(160 / 255)
         assert parsed.green == approx(68 / 255)
         assert parsed.blue == approx(233 / 255)
+        assert RGB.parse("#00FF7f") == RGB(0, 1, 127 / 255)
 
         with pytest.raises(AssertionError, match="RGB"):
             RGB.parse(object())  # type: ignore
@@ -140,3 +141,15 @@ class TestSides:
 
         with pytest.raises(TypeError, match="sides"):
             Sides.parse("foo")  # type: ignore[arg-type]
+
+
+class TestDictget:
+    def test_call(self):
+        f = dictget({"a": 1, "b": 2}, 0)
+        assert f("a") == 1
+        assert f("c") == 0
+
+    def test_many(self):
+        f = dictget({"a": 1, "b": 2}, 0)
+        assert list(f.many("abcb")) == [1, 2, 0, 2]
+        assert list(f.many("")) == []
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import gc
 from itertools import cycle, islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
 import pytest
 from hypothesis import given
@@ -18,6 +20,9 @@ from pdfje.units import A4, A5, A6, inch, mm
 
 from .common import LOREM_IPSUM, LOREM_SHORT, ZEN_OF_PYTHON
 
+if TYPE_CHECKING:
+    from fontTools.ttLib import TTFont
+
 try:
     import fontTools  # noqa
 except ModuleNotFoundError:
@@ -48,6 +53,10 @@ class TestWrite:
         assert isinstance(next(output), bytes)
         assert b"".join(output).endswith(b"%%EOF\n")
 
+    def test_output_per_object(self):
+        # header, 2 page objects, catalog, pagetree, resources, trailer
+        assert len(list(Document().write())) == 7
+
     def test_string(self, tmpdir):
         loc = str(tmpdir / "foo.pdf")
         Document().write(loc)
@@ -64,6 +73,65 @@ class TestWrite:
             Document().write(f)
         assert loc.read_bytes().endswith(b"%%EOF\n")
 
+    def test_unbuffered_fileobj(self, tmpdir):
+        loc = Path(tmpdir / "foo.pdf")
+        with loc.open(mode="wb", buffering=0) as f:
+            Document().write(f)
+            assert not f.closed
+        assert loc.read_bytes().endswith(b"%%EOF\n")
+
+    @pytest.mark.skipif(not HAS_FONTTOOLS, reason="fontTools not installed")
+    def test_embedded_fonts_released(self, dejavu: TrueType):
+        from pdfje.fonts.embed import Subset
+
+        def live_subsets() -> int:
+            gc.collect()
+            return sum(type(o) is Subset for o in gc.get_objects())
+
+        before = live_subsets()
+        for _ in range(3):
+            b"".join(
+                Document(
+                    [AutoPage(Paragraph(LOREM_SHORT, Style(font=dejavu)))]
+                ).write()
+            )
+        assert live_subsets() == before
+
+    @pytest.mark.skipif(not HAS_FONTTOOLS, reason="fontTools not installed")
+    def test_embedded_font_files_closed(self, dejavu: TrueType, monkeypatch):
+        from pdfje.fonts import embed
+
+        opened: list[TTFont] = []
+        load = embed._load
+
+        def _load(f: Path) -> TTFont:
+            ttf = load(f)
+            opened.append(ttf)
+            return ttf
+
+        monkeypatch.setattr(embed, "_load", _load)
+        doc = Document([AutoPage(Paragraph(LOREM_SHORT, Style(font=dejavu)))])
+
+        b"".join(doc.write())
+        assert len(opened) == 1
+        assert opened[0].reader is None
+
+        # writing abandoned halfway
+        output = doc.write()
+        list(islice(output, 3))
+        assert opened[1].reader is not None
+        output.close()  # type: ignore[attr-defined]
+        assert opened[1].reader is None
+
+        # writing fails
+        def pages() -> Iterator[AutoPage]:
+            yield AutoPage(Paragraph(LOREM_SHORT, Style(font=dejavu)))
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            b"".join(Document(pages()).write())
+        assert opened[2].reader is None
+
 
 class TestInit:
     def test_empty(self, outfile):
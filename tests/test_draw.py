@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pdfje.common import XY
-from pdfje.draw import Polyline, Rect
+from pdfje.draw import Circle, Ellipse, Polyline, Rect
 
 NA = NotImplemented
 
@@ -48,3 +48,23 @@ class TestRect:
             b"".join(Rect((2, 3), 4, 5, stroke=None).render(NA, NA))
             == b"2 3 4 5 re n\n"
         )
+
+
+class TestEllipse:
+    def test_render(self):
+        assert b"".join(
+            Ellipse((3, 4), 10, 6, fill="#ff0000").render(NA, NA)
+        ) == (
+            b"-2 4 m -2 2.34315 0.238576 1 3 1 c 5.76142 1 8 2.34315 8 4 c "
+            b"8 5.65685 5.76142 7 3 7 c 0.238576 7 -2 5.65685 -2 4 c "
+            b"1 0 0 rg 0 0 0 RG B\n"
+        )
+
+
+class TestCircle:
+    def test_render(self):
+        assert b"".join(Circle((0, 0), 2, stroke=None).render(NA, NA)) == (
+            b"-2 0 m -2 -1.10457 -1.10457 -2 0 -2 c "
+            b"1.10457 -2 2 -1.10457 2 0 c 2 1.10457 1.10457 2 0 2 c "
+            b"-1.10457 2 -2 1.10457 -2 0 c n\n"
+        )
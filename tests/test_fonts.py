@@ -6,6 +6,7 @@ from random import Random
 import pytest
 
 from pdfje.common import dictget
+from pdfje.fonts import courier, helvetica
 from pdfje.fonts.common import KerningTable, TrueType, kern
 from pdfje.fonts.embed import Subset, _utf16be_hex
 
@@ -69,6 +70,38 @@ class TestKern:
         ]
 
 
+def test_monospace_width():
+    font = courier.bold
+    assert font.width("Lorem ipsum") == 11 * 0.6
+    assert font.width("") == 0
+
+
+class TestMeasure:
+    def test_width_includes_kerning(self):
+        font = helvetica.regular
+        kerning, width = font.measure("AVA", " ")
+        assert kerning == list(font.kern("AVA", " "))
+        assert kerning
+        assert width == font.width("AVA") + sum(k for _, k in kerning) / 1000
+
+    def test_cached(self):
+        assert helvetica.regular.measure(
+            "Lorem", None
+        ) is helvetica.regular.measure("Lorem", None)
+        assert helvetica.regular.measure(
+            "Lorem", None
+        ) is not helvetica.bold.measure("Lorem", None)
+
+    def test_cached_per_subset(self, dejavu: TrueType):
+        pytest.importorskip("fontTools")
+        a = Subset.new(b"F1", dejavu.regular)
+        b = Subset.new(b"F2", dejavu.regular)
+        assert a.measure("AVA", " ") is a.measure("AVA", " ")
+        assert a.measure("AVA", " ") is not b.measure("AVA", " ")
+        assert a.measure("AVA", " ") == b.measure("AVA", " ")
+        assert list(a.measured) == [("AVA", " ")]
+
+
 class TestEncodeEmbeddedSubset:
     def test_empty(self):
         assert _make_subset({}).encode("") == b""
@@ -113,6 +146,40 @@ def test_true_type_init():
     assert isinstance(t.bold, Path)
 
 
+def test_subset_kerning_reused(dejavu: TrueType):
+    pytest.importorskip("fontTools")
+    a = Subset.new(b"F1", dejavu.regular)
+    b = Subset.new(b"F2", dejavu.regular)
+    assert a.kerning is not None
+    assert a.kerning is b.kerning
+    assert a.ttf is not b.ttf
+
+
+def test_subset_kerning_cache(dejavu: TrueType, monkeypatch):
+    pytest.importorskip("fontTools")
+    from fontTools.ttLib import TTFont
+
+    from pdfje.fonts import embed
+
+    embed._kerning_slot.cache_clear()
+    loaded = []
+    load = embed._load
+
+    def _load(f: Path) -> TTFont:
+        loaded.append(f)
+        return load(f)
+
+    monkeypatch.setattr(embed, "_load", _load)
+
+    # the font file is only parsed once, also on a cache miss
+    Subset.new(b"F1", dejavu.regular)
+    assert loaded == [dejavu.regular]
+    assert embed._kerning_slot.cache_info().misses == 1
+
+    Subset.new(b"F2", dejavu.regular)
+    assert embed._kerning_slot.cache_info().hits == 1
+
+
 @pytest.mark.skipif(HAS_FONTTOOLS, reason="fontTools installed")
 def test_fonttools_notimplemented():
     with pytest.raises(NotImplementedError):
@@ -77,6 +77,12 @@ class TestStyleLikeUnion:
         with pytest.raises(TypeError, match="operand"):
             Style(italic=True) | 1  # type: ignore[operator]
 
+    def test_empty_is_reused(self):
+        s = Style(italic=True, color=RED)
+        assert s | Style.EMPTY is s
+        assert Style.EMPTY | s is s
+        assert STYLE | Style.EMPTY is STYLE
+
     def test_font_and_other(self):
         assert times_roman | Style(italic=True) == Style(
             italic=True, font=times_roman
@@ -25,5 +25,13 @@ class TestParseHyphenator:
         assert hasattr(result, "__iter__")
         assert list(result) == ["beau", "ti", "ful"]
 
+    @pytest.mark.skipif(not HAS_PYPHEN, reason="pyphen not installed")
+    def test_pyphen_reused(self):
+        from pyphen import Pyphen
+
+        p = Pyphen(lang="nl_NL")
+        assert parse_hyphenator(p) is parse_hyphenator(p)
+        assert parse_hyphenator(p) is not parse_hyphenator(Pyphen(lang="nl"))
+
     def test_none(self):
         assert parse_hyphenator(None) is never_hyphenate
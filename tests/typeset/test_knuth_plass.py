@@ -179,6 +179,24 @@ class TestOptimalBreaks:
         with pytest.raises(NoFeasibleBreaks):
             fit(boxes, lambda _: 130, 1)
 
+    @pytest.mark.parametrize(
+        "boxes",
+        [
+            [
+                spaced_box(10, space=5, stretch=1),
+                spaced_box(200, space=5, stretch=1),
+            ],
+            [
+                spaced_box(10, space=5, stretch=1),
+                spaced_box(200, space=5, stretch=1),
+                spaced_box(250, space=5, stretch=1),
+            ],
+        ],
+    )
+    def test_ragged_box_wider_than_line(self, boxes):
+        with pytest.raises(NoFeasibleBreaks):
+            fit(boxes, lambda _: 100, float("inf"), ragged=True)
+
     def test_nobreak_box(self):
         boxes = [
             spaced_box(10, space=5, stretch=0, shrink=0),
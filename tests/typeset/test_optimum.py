@@ -243,6 +243,34 @@ class TestShape:
         assert linecounts == [0, 3, 4]
         assert plaintext(shaped).strip() == plaintext(words).strip()
 
+    @pytest.mark.parametrize(
+        "width, expect_linecounts",
+        [
+            # The text fits on one (very tight) justified line, but the
+            # optimal result is to spread it over two lines.
+            (4340, [0, 2]),
+            # The text fits on one line, and this is also optimal.
+            (4452, [1]),
+        ],
+    )
+    def test_first_line_could_fit_entire_paragraph(
+        self, width, expect_linecounts, words
+    ):
+        shaped = list(
+            shape(
+                iter(words),
+                iter([XY(width, 30), XY(width, 90), XY(width, 300)]),
+                allow_empty=True,
+                lead=25,
+                avoid_orphans=True,
+                align=Align.JUSTIFY,
+                params=PARAMS,
+            )
+        )
+        linecounts = [len(c.lines) for c in shaped]
+        assert linecounts == expect_linecounts
+        assert plaintext(shaped).strip() == plaintext(words).strip()
+
     @pytest.mark.parametrize("align", [Align.LEFT, Align.JUSTIFY])
     @pytest.mark.parametrize("allow_empty", [True, False])
     def test_first_line_orphan_not_prevented(self, align, allow_empty, words):
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 from pdfje.atoms import LiteralStr, Real
-from pdfje.typeset.state import NO_OP, Passage, splitlines
+from pdfje.typeset.state import NO_OP, Passage, SetColor, SetFont, splitlines
 from pdfje.typeset.words import _encode_kerning
 
-from ..common import BIG, BLUE, FONT, GREEN, RED
+from ..common import BIG, BLUE, FONT, GREEN, RED, STATE
+
+
+def test_state_prologue():
+    assert b"".join(STATE) == b"".join(
+        [
+            *SetFont(STATE.font, STATE.size),
+            *SetColor(STATE.color),
+        ]
+    )
 
 
 class TestSplitlines:
@@ -80,6 +89,12 @@ class TestEncodeKerning:
             LiteralStr(b"cdefg"),
         ]
 
+    def test_only_kern_first_char(self):
+        assert list(_encode_kerning("abc", [(0, -20)], FONT)) == [
+            Real(20),
+            LiteralStr(b"abc"),
+        ]
+
     def test_no_kern(self):
         assert list(_encode_kerning("abcdefg", [], FONT)) == [
             LiteralStr(b"abcdefg")
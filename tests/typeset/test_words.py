@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from functools import partial
-from typing import Generator, TypeVar
+from typing import Generator, Iterable, TypeVar, cast
 
 import pytest
 
@@ -179,6 +179,8 @@ class TestMixedSlug:
         assert s.minimal_box() == (s, None)
         assert s.prunable_space() == 0
         assert s.tail is None
+        assert not s.has_init_kern()
+        assert s.without_init_kern() is s
 
     def test_init_kern(self):
         s = MixedSlug(
@@ -249,6 +251,24 @@ class TestWord:
         assert word.prunable_space() == word.tail.width()
         assert word.tail is not None
 
+    def test_new_is_reused(self):
+        word = Word.new("complex. ", STATE, " ")
+        assert Word.new("complex. ", STATE, " ") is word
+        assert Word.new("complex. ", STATE, None) is not word
+        assert Word.new("complex. ", STATE, None) == word.without_init_kern()
+
+    def test_new_unhashable_hyphens(self):
+        @dataclass
+        class Hyphens:
+            def __call__(self, s: str) -> Iterable[str]:
+                return hyphenate_word(s)
+
+        word = Word.new("complex. ", replace(STATE, hyphens=Hyphens()), " ")
+        expect = Word.new("complex. ", STATE, " ")
+        assert all(isinstance(b, Slug) for b in word.boxes)
+        assert [cast(Slug, b).txt for b in word.boxes] == ["com", "plex."]
+        assert word.width == expect.width
+
     def test_init_kern(self):
         word = Word.new("complex. ", STATE, " ")
         assert word.has_init_kern()